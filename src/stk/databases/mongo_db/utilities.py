@@ -1,6 +1,16 @@
 class HashableDict(dict):
     def __hash__(self):
-        return hash((frozenset(self), frozenset(self.values())))
+        # The hash gets computed twice per lru_cache miss, once for
+        # the lookup and once for the insertion, and each computation
+        # builds two frozensets. Cache it on first use, the dict is
+        # never modified once it is used as a cache key.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(
+                (frozenset(self), frozenset(self.values()))
+            )
+            return self._hash
 
     def __eq__(self, other):
         return super().__eq__(other)
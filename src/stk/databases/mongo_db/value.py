@@ -113,6 +113,11 @@ class ValueMongoDb(ValueDatabase):
         self._key_makers = key_makers
         self._put = lru_cache(maxsize=lru_cache_size)(self._put)
         self._get = lru_cache(maxsize=lru_cache_size)(self._get)
+        # Making the molecular keys is expensive, caching on the
+        # molecule itself means repeated calls with the same molecule
+        # skip key creation entirely. Failed lookups are not cached by
+        # lru_cache, so a KeyError does not get stuck in the cache.
+        self.get = lru_cache(maxsize=lru_cache_size)(self.get)
 
         index_information = self._values.index_information()
         if 'v_1' not in index_information:
@@ -137,17 +142,18 @@ class ValueMongoDb(ValueDatabase):
         self._values.insert_one(json)
 
     def get(self, molecule):
-
-        def make_dict(key_maker):
-            return HashableDict({
-                key_maker.get_key_name():
-                key_maker.get_key(molecule)
-            })
-
-        key = {'$or': tuple(map(make_dict, self._key_makers))}
         # lru_cache requires that the parameters to the cached function
         # are hashable objects.
-        return self._get(HashableDict(key))
+        key = HashableDict({
+            '$or': tuple(
+                HashableDict({
+                    key_maker.get_key_name():
+                    key_maker.get_key(molecule)
+                })
+                for key_maker in self._key_makers
+            ),
+        })
+        return self._get(key)
 
     def _get(self, key):
         value = self._values.find_one(key)
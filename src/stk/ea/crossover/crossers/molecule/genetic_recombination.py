@@ -165,17 +165,16 @@ class GeneticRecombination(MoleculeCrosser):
             topology_graphs,
             self._get_alleles(records),
         ):
-
-            def get_replacement(building_block):
-                gene = self._get_gene(building_block)
-                return next(
-                    allele for allele in alleles
-                    if self._get_gene(allele) == gene
-                )
-
+            # Map each gene to its picked allele once, instead of
+            # re-scanning the alleles for every building block.
+            replacements = {
+                self._get_gene(allele): allele for allele in alleles
+            }
             topology_graph = topology_graph.with_building_blocks(
                 building_block_map={
-                    building_block: get_replacement(building_block)
+                    building_block: replacements[
+                        self._get_gene(building_block)
+                    ]
                     for building_block
                     in topology_graph.get_building_blocks()
                 },
@@ -43,8 +43,20 @@ class Implementation:
         def get_mutation_record(batch):
             return self._mutator.mutate(batch[0])
 
+        # Computing a molecule key can be expensive and survivors are
+        # deduplicated on every generation, so cache the key of each
+        # molecule. Clones made by with_fitness_value() share their
+        # molecule, which means the cache persists across generations.
+        key_cache = {}
+
         def get_key(record):
-            return self._key_maker.get_key(record.get_molecule())
+            molecule = record.get_molecule()
+            key = key_cache.get(molecule)
+            if key is None:
+                key = key_cache[molecule] = (
+                    self._key_maker.get_key(molecule)
+                )
+            return key
 
         population = self._initial_population
 
@@ -62,9 +74,9 @@ class Implementation:
         )
 
         for generation in range(1, num_generations):
-            self._logger.info(f'Starting generation {generation}.')
+            self._logger.info('Starting generation %s.', generation)
             self._logger.info(
-                f'Population size is {len(population)}.'
+                'Population size is %s.', len(population),
             )
 
             self._logger.info('Doing crossovers.')
@@ -106,6 +118,17 @@ class Implementation:
                 in self._generation_selector.select(population)
             )
 
+            # Stop the cache from growing with every molecule ever
+            # seen. Keys of molecules which did not survive selection
+            # are never needed again, because new offspring are always
+            # new molecule objects.
+            survivors = frozenset(
+                record.get_molecule() for record in population
+            )
+            for molecule in tuple(key_cache):
+                if molecule not in survivors:
+                    del key_cache[molecule]
+
             yield Generation(
                 molecule_records=population,
                 mutation_records=mutation_records,
@@ -117,12 +140,23 @@ class Implementation:
             yield from self._crosser.cross(batch)
 
     def _with_fitness_values(self, map_, population):
-        molecules = (record.get_molecule() for record in population)
-        fitness_values = map_(
+        # The unnormalized fitness value of a record is constant
+        # across generations, so only records which do not have one
+        # yet are sent for calculation. This stops survivors from
+        # being needlessly recalculated every generation.
+        unevaluated = tuple(
+            record for record in population
+            if record.get_fitness_value(normalized=False) is None
+        )
+        molecules = (record.get_molecule() for record in unevaluated)
+        new_fitness_values = iter(map_(
             self._fitness_calculator.get_fitness_value,
             molecules,
-        )
-        for record, fitness_value in zip(population, fitness_values):
+        ))
+        for record in population:
+            fitness_value = record.get_fitness_value(normalized=False)
+            if fitness_value is None:
+                fitness_value = next(new_fitness_values)
             yield record.with_fitness_value(
                 fitness_value=fitness_value,
                 normalized=False,
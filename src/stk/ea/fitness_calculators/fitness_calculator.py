@@ -25,6 +25,11 @@ class FitnessCalculator:
 
     """
 
+    # Subclasses declare their attributes in __slots__, an empty
+    # declaration here keeps instances free of a per-instance
+    # __dict__.
+    __slots__ = []
+
     def get_fitness_value(self, molecule):
         """
         Return the fitness value of `molecule`.
@@ -42,3 +47,26 @@ class FitnessCalculator:
         """
 
         raise NotImplementedError()
+
+    def get_fitness_values(self, molecules):
+        """
+        Yield the fitness value of each molecule in `molecules`.
+
+        The default implementation simply calls
+        :meth:`.get_fitness_value` once per molecule, but subclasses
+        can override this method, if the fitness values of multiple
+        molecules can be calculated more efficiently together.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.ConstructedMolecule`
+            The molecules whose fitness values should be calculated.
+
+        Yields
+        ------
+        :class:`object`
+            The fitness value of a molecule in `molecules`.
+
+        """
+
+        yield from map(self.get_fitness_value, molecules)
@@ -134,6 +134,12 @@ class FitnessFunction(FitnessCalculator):
 
     """
 
+    __slots__ = [
+        '_fitness_function',
+        '_input_database',
+        '_output_database',
+    ]
+
     def __init__(
         self,
         fitness_function,
@@ -168,12 +174,15 @@ class FitnessFunction(FitnessCalculator):
         self._output_database = output_database
 
     def get_fitness_value(self, molecule):
+        # Keep a single calculation path, instead of duplicating the
+        # call to the fitness function across branches.
+        fitness_value = not_found = object()
         if self._input_database is not None:
             try:
                 fitness_value = self._input_database.get(molecule)
             except KeyError:
-                fitness_value = self._fitness_function(molecule)
-        else:
+                pass
+        if fitness_value is not_found:
             fitness_value = self._fitness_function(molecule)
 
         if self._output_database is not None:
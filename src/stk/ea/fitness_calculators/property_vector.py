@@ -4,6 +4,8 @@ Property Vector
 
 """
 
+import math
+
 from .fitness_calculator import FitnessCalculator
 
 
@@ -165,6 +167,12 @@ class PropertyVector(FitnessCalculator):
 
     """
 
+    __slots__ = [
+        '_property_functions',
+        '_input_database',
+        '_output_database',
+    ]
+
     def __init__(
         self,
         property_functions,
@@ -196,12 +204,47 @@ class PropertyVector(FitnessCalculator):
 
         """
 
-        self._property_functions = property_functions
+        # Freezing the property functions into a tuple makes
+        # iteration in _get_property_vector as cheap as possible and
+        # means the calculator is safe from later mutation of the
+        # parameter.
+        self._property_functions = tuple(property_functions)
         self._input_database = input_database
         self._output_database = output_database
 
     def get_fitness_value(self, molecule):
-        return tuple(
-            property_function(molecule)
-            for property_function in self._property_functions
-        )
+        # Keep a single calculation path, instead of duplicating the
+        # call to the property functions across branches.
+        fitness_value = not_found = object()
+        if self._input_database is not None:
+            try:
+                fitness_value = self._input_database.get(molecule)
+            except KeyError:
+                pass
+        if fitness_value is not_found:
+            fitness_value = self._get_property_vector(molecule)
+
+        if self._output_database is not None:
+            self._output_database.put(molecule, fitness_value)
+
+        return fitness_value
+
+    def _get_property_vector(self, molecule):
+        # The local rebind avoids an attribute load per property
+        # function.
+        property_functions = self._property_functions
+        property_vector = []
+        for index, property_function in enumerate(property_functions):
+            value = property_function(molecule)
+            property_vector.append(value)
+            # A non-finite property means the calculation failed, so
+            # the remaining, potentially expensive, property functions
+            # do not need to run. The rest of the vector is padded
+            # with nan values.
+            if isinstance(value, float) and not math.isfinite(value):
+                property_vector.extend(
+                    [math.nan]
+                    * (len(property_functions) - index - 1)
+                )
+                break
+        return tuple(property_vector)
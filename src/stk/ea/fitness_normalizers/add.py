@@ -101,13 +101,16 @@ class Add(FitnessNormalizer):
         self._filter = filter
 
     def normalize(self, population):
+        # Hoist the attribute lookups out of the loop.
+        filter_ = self._filter
+        number = self._number
         for record in population:
-            if self._filter(population, record):
+            if filter_(population, record):
                 # Use np.add here so that both tuples and arrays
                 # work properly.
                 yield record.with_fitness_value(
                     fitness_value=np.add(
-                        self._number,
+                        number,
                         record.get_fitness_value(),
                     ),
                 )
@@ -84,18 +84,24 @@ class DivideByMean(FitnessNormalizer):
         self._filter = filter
 
     def normalize(self, population):
-        filtered = filter(
+        # Evaluate the filter just once per record, it gets used both
+        # for computing the mean and for deciding which records to
+        # normalize.
+        filtered = tuple(filter(
             partial(self._filter, population),
             population,
-        )
+        ))
         mean = np.mean(
             a=[record.get_fitness_value() for record in filtered],
             axis=0,
         )
-        logger.debug(f'Means used: {mean}')
+        # Lazy %-formatting avoids building the message when debug
+        # logging is off.
+        logger.debug('Means used: %s', mean)
 
+        filtered = frozenset(filtered)
         for record in population:
-            if self._filter(population, record):
+            if record in filtered:
                 yield record.with_fitness_value(
                     fitness_value=np.divide(
                         record.get_fitness_value(),
@@ -104,14 +104,17 @@ class Multiply(FitnessNormalizer):
         self._filter = filter
 
     def normalize(self, population):
+        # Hoist the attribute lookups out of the loop.
+        filter_ = self._filter
+        coefficient = self._coefficient
         for record in population:
-            if self._filter(population, record):
+            if filter_(population, record):
                 # Use np.multiply here so that both lists and arrays
                 # work properly. If * is used [8]*3 will wrongly make
                 # [8, 8, 8].
                 yield record.with_fitness_value(
                     fitness_value=np.multiply(
-                        self._coefficient,
+                        coefficient,
                         record.get_fitness_value(),
                     ),
                 )
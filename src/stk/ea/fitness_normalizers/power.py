@@ -120,12 +120,15 @@ class Power(FitnessNormalizer):
         self._filter = filter
 
     def normalize(self, population):
+        # Hoist the attribute lookups out of the loop.
+        filter_ = self._filter
+        power = self._power
         for record in population:
-            if self._filter(population, record):
+            if filter_(population, record):
                 yield record.with_fitness_value(
                     fitness_value=np.float_power(
                         record.get_fitness_value(),
-                        self._power,
+                        power,
                     ),
                 )
             else:
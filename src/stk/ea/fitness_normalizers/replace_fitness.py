@@ -83,9 +83,14 @@ class ReplaceFitness(FitnessNormalizer):
         self._filter = filter
 
     def normalize(self, population):
-        replacement = self._get_replacement(population)
+        # The replacement value can be expensive to calculate, only
+        # compute it once a record actually needs it.
+        replacement = not_computed = object()
+        filter_ = self._filter
         for record in population:
-            if self._filter(population, record):
+            if filter_(population, record):
+                if replacement is not_computed:
+                    replacement = self._get_replacement(population)
                 yield record.with_fitness_value(replacement)
             else:
                 yield record
@@ -98,10 +98,13 @@ class ShiftUp(FitnessNormalizer):
         self._filter = filter
 
     def normalize(self, population):
-        filtered = filter(
+        # Evaluate the filter just once per record, it gets used both
+        # for computing the shift and for deciding which records to
+        # normalize.
+        filtered = tuple(filter(
             partial(self._filter, population),
             population,
-        )
+        ))
         # Get all the fitness arrays in a matrix.
         fmat = np.array([
             record.get_fitness_value() for record in filtered
@@ -114,14 +117,13 @@ class ShiftUp(FitnessNormalizer):
         mins = np.min(fmat, axis=0, keepdims=len(fmat.shape) == 1)
 
         # Convert all elements in mins which are not to be shifted to 0
-        # and make the shift equal to the minimum value + 1.
-        shift = np.zeros(len(mins))
-        for i, min_ in enumerate(mins):
-            if min_ <= 0:
-                shift[i] = 1 - min_
+        # and make the shift equal to the minimum value + 1. A single
+        # vectorized pass replaces a Python loop over the elements.
+        shift = np.where(mins <= 0, 1-mins, 0.)
 
+        filtered = frozenset(filtered)
         for record in population:
-            if self._filter(population, record):
+            if record in filtered:
                 yield record.with_fitness_value(
                     fitness_value=record.get_fitness_value() + shift,
                 )
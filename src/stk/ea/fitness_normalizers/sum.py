@@ -79,8 +79,10 @@ class Sum(FitnessNormalizer):
         self._filter = filter
 
     def normalize(self, population):
+        # Hoist the attribute lookup out of the loop.
+        filter_ = self._filter
         for record in population:
-            if self._filter(population, record):
+            if filter_(population, record):
                 yield record.with_fitness_value(
                     fitness_value=sum(record.get_fitness_value()),
                 )
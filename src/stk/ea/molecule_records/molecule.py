@@ -20,6 +20,15 @@ class MoleculeRecord:
 
     """
 
+    # A record is made for every molecule in every generation, using
+    # __slots__ keeps them small.
+    __slots__ = [
+        '_molecule',
+        '_topology_graph',
+        '_fitness_value',
+        '_normalized_fitness_value',
+    ]
+
     def __init__(self, topology_graph):
         """
         Initialize a :class:`.MoleculeRecord` instance.
@@ -120,9 +120,9 @@ class SimilarBuildingBlock(MoleculeMutator):
         key = self._key_maker.get_key(record.get_molecule())
         if key not in self._similar_building_blocks:
             # Maps the key to a dict. The dict maps each
-            # building block to an iterator.
-            # The iterators yield the next most similar molecules in
-            # `building_blocks` to the building block.
+            # building block to the molecules in `building_blocks`,
+            # sorted from most to least similar, and the index of the
+            # next replacement to use.
             self._similar_building_blocks[key] = {}
 
         similar_building_blocks = self._similar_building_blocks[key]
@@ -136,46 +136,42 @@ class SimilarBuildingBlock(MoleculeMutator):
             a=replaceable_building_blocks,
         )
 
-        # If the building block has not been chosen before, create an
-        # iterator yielding similar molecules from `building_blocks`
-        # for it.
+        # If the building block has not been chosen before, sort the
+        # molecules in `building_blocks` by similarity to it. The
+        # sorted tuple is kept, so that wrapping around to the start,
+        # once every molecule has been used, does not recompute the
+        # similarities or raise StopIteration in the hot loop.
         replaced_key = self._key_maker.get_key(replaced_building_block)
         if replaced_key not in similar_building_blocks:
-            similar_building_blocks[replaced_key] = iter(sorted(
-                self._building_blocks,
-                key=partial(dice_similarity, replaced_building_block),
-                reverse=True,
-            ))
-
-        try:
-            replacement = next(similar_building_blocks[replaced_key])
-        except StopIteration:
-            similar_building_blocks[replaced_key] = iter(sorted(
-                self._building_blocks,
-                key=partial(dice_similarity, replaced_building_block),
-                reverse=True,
-            ))
-            replacement = next(similar_building_blocks[replaced_key])
-
-        # If the most similar molecule in `building_blocks` is itself,
-        # then take the next most similar one.
-        if self._key_maker.get_key(replacement) == replaced_key:
-            try:
-                replacement = next(
-                    similar_building_blocks[replaced_key]
-                )
-            except StopIteration:
-                similar_building_blocks[replaced_key] = iter(sorted(
+            similar_building_blocks[replaced_key] = [
+                sorted(
                     self._building_blocks,
                     key=partial(
                         dice_similarity,
                         replaced_building_block,
                     ),
                     reverse=True,
-                ))
-                replacement = next(
-                    similar_building_blocks[replaced_key]
-                )
+                ),
+                0,
+            ]
+
+        sorted_building_blocks, index = (
+            similar_building_blocks[replaced_key]
+        )
+        replacement = sorted_building_blocks[
+            index % len(sorted_building_blocks)
+        ]
+        index += 1
+
+        # If the most similar molecule in `building_blocks` is itself,
+        # then take the next most similar one.
+        if self._key_maker.get_key(replacement) == replaced_key:
+            replacement = sorted_building_blocks[
+                index % len(sorted_building_blocks)
+            ]
+            index += 1
+
+        similar_building_blocks[replaced_key][1] = index
 
         # Build the new ConstructedMolecule.
         graph = record.get_topology_graph().with_building_blocks({
@@ -139,7 +139,9 @@ class ProgressPlotter:
         self._plot_data = self._get_plot_data(generations)
 
     def _get_plot_data(self, generations):
-        df = pd.DataFrame()
+        # Appending to a DataFrame copies it, so collect the rows
+        # first and make the DataFrame in one go.
+        rows = []
         self._num_generations = 0
         for id_, generation in enumerate(generations):
             self._num_generations += 1
@@ -155,26 +157,27 @@ class ProgressPlotter:
             if not properties:
                 continue
 
-            data = [
+            # Computing the statistics on a single array avoids three
+            # Python-level passes over the property values.
+            property_array = np.asarray(properties)
+            rows.extend((
                 {
                     'Generation': id_,
-                    self._y_label: max(properties),
+                    self._y_label: property_array.max(),
                     'Type': 'Max'
                 },
                 {
                     'Generation': id_,
-                    self._y_label: np.mean(properties),
+                    self._y_label: property_array.mean(),
                     'Type': 'Mean'
                 },
                 {
                     'Generation': id_,
-                    self._y_label: min(properties),
+                    self._y_label: property_array.min(),
                     'Type': 'Min'
                 },
-            ]
-
-            df = df.append(data, ignore_index=True)
-        return df
+            ))
+        return pd.DataFrame(rows)
 
     def get_plot_data(self):
         """
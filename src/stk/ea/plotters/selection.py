@@ -164,16 +164,17 @@ class SelectionPlotter:
 
         self._plots += 1
         sns.set(style='darkgrid')
-        df = pd.DataFrame()
-        for record, selection_count in counter.items():
-            label = self._record_label(record)
-            data = {
-                self._x_label: label,
+        # Appending to a DataFrame copies it, so collect the rows
+        # first and make the DataFrame in one go.
+        df = pd.DataFrame([
+            {
+                self._x_label: self._record_label(record),
                 'Number of Times Selected': selection_count,
                 'order': self._order_by(record),
-                'heat_map': self._heat_map_value(record)
+                'heat_map': self._heat_map_value(record),
             }
-            df = df.append(data, ignore_index=True)
+            for record, selection_count in counter.items()
+        ])
 
         df = df.sort_values(
             ['Number of Times Selected', 'order'],
@@ -50,7 +50,12 @@ class Batch:
 
     """
 
-    __slots__ = ('_records', '_fitness_value', '_identity_key')
+    __slots__ = (
+        '_records',
+        '_fitness_value',
+        '_identity_key',
+        '_key_maker',
+    )
 
     def __init__(self, records, fitness_values, key_maker):
         """
@@ -74,11 +79,20 @@ class Batch:
         """
 
         self._records = records
-        self._fitness_value = sum(map(fitness_values.get, records))
-        molecules = (record.get_molecule() for record in records)
-        self._identity_key = frozenset(
-            Counter(map(key_maker.get_key, molecules)).items()
-        )
+        # Most batches hold a single record, for which the sum is
+        # pure overhead.
+        if len(records) == 1:
+            record, = records
+            self._fitness_value = fitness_values[record]
+        else:
+            self._fitness_value = sum(
+                map(fitness_values.get, records)
+            )
+        # Making molecule keys is expensive and most batches never
+        # have their identity checked, so the identity key is only
+        # made on first use, in get_identity_key().
+        self._key_maker = key_maker
+        self._identity_key = None
 
     def get_size(self):
         """
@@ -121,6 +135,21 @@ class Batch:
 
         """
 
+        if self._identity_key is None:
+            records = self._records
+            key_maker = self._key_maker
+            if len(records) == 1:
+                record, = records
+                self._identity_key = frozenset((
+                    (key_maker.get_key(record.get_molecule()), 1),
+                ))
+            else:
+                molecules = (
+                    record.get_molecule() for record in records
+                )
+                self._identity_key = frozenset(
+                    Counter(map(key_maker.get_key, molecules)).items()
+                )
         return self._identity_key
 
     def __iter__(self):
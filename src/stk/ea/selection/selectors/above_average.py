@@ -110,23 +110,39 @@ class AboveAverage(Selector):
         )
 
     def _select_from_batches(self, batches, yielded_batches):
-        mean = np.mean([
-            batch.get_fitness_value() for batch in batches
-        ])
-        # Yield highest fitness batches first.
-        batches = sorted(batches, reverse=True)
-        # Yield only batches with a fitness larger than the mean.
-        batches = it.takewhile(
-            lambda batch: batch.get_fitness_value() > mean,
-            batches
+        # np.fromiter fills a float array directly, skipping the
+        # intermediate list of boxed Python floats.
+        fitness_values = np.fromiter(
+            (batch.get_fitness_value() for batch in batches),
+            dtype=np.float64,
+            count=len(batches),
         )
+        mean = fitness_values.mean()
+        # Yield highest fitness batches first. Sorting the float
+        # array does one rich comparison per pair of floats, instead
+        # of per pair of batches, and the stable kind keeps the
+        # order of equally fit batches, like sorted() does.
+        order = np.argsort(-fitness_values, kind='stable')
+        # Yield only batches with a fitness larger than the mean. The
+        # sorted fitness array gives the cutoff directly with a
+        # binary search, instead of a Python-level comparison per
+        # batch.
+        num_above = int(np.searchsorted(
+            -fitness_values[order],
+            -mean,
+            side='left',
+        ))
+        batches = [batches[index] for index in order[:num_above]]
         # Yield batches which are multiple times better than the mean
-        # multiple times.
-        batches = (
-            batch
-            for batch in batches
-            for i in range(self._get_num_duplicates(batch, mean))
-        )
+        # multiple times. When duplicates are not allowed every batch
+        # is yielded exactly once, so the expansion, and the
+        # per-batch duplicate count, can be skipped entirely.
+        if self._duplicate_batches and self._duplicate_molecules:
+            batches = (
+                batch
+                for batch in batches
+                for i in range(self._get_num_duplicates(batch, mean))
+            )
         # If duplicate molecules are not allowed, allow only
         # batches with no yielded molecules.
         if not self._duplicate_molecules:
@@ -145,6 +161,4 @@ class AboveAverage(Selector):
         yield from it.islice(batches, self._num_batches)
 
     def _get_num_duplicates(self, batch, mean):
-        if self._duplicate_batches and self._duplicate_molecules:
-            return int(batch.get_fitness_value() // mean)
-        return 1
+        return int(batch.get_fitness_value() // mean)
@@ -5,6 +5,7 @@ Best
 """
 
 import itertools as it
+from heapq import nlargest
 
 from stk.molecular import Inchi
 from .selector import Selector
@@ -109,6 +110,18 @@ class Best(Selector):
         )
 
     def _select_from_batches(self, batches, yielded_batches):
+        # If no batches get filtered out, only the top num_batches
+        # ones can be yielded, and a bounded heap finds those without
+        # sorting every batch. nlargest() is documented to be
+        # equivalent to sorted(batches, reverse=True)[:num_batches].
+        if (
+            self._num_batches is not None
+            and self._duplicate_molecules
+            and self._duplicate_batches
+        ):
+            yield from nlargest(self._num_batches, batches)
+            return
+
         batches = sorted(batches, reverse=True)
 
         if not self._duplicate_molecules:
@@ -66,8 +66,10 @@ class FilterBatches(Selector):
                 excluded_batches=excluded_batches,
             )
         }
+        # The allowed batches were selected with excluded_batches
+        # already applied, so the exclusions do not need to be
+        # checked a second time by the selector.
         yield from self._selector.select(
             population=population,
             included_batches=allowed,
-            excluded_batches=excluded_batches,
         )
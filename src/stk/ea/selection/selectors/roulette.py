@@ -5,6 +5,7 @@ Roulette
 """
 
 import numpy as np
+import itertools as it
 
 from stk.molecular import Inchi
 from .selector import Selector
@@ -114,9 +115,6 @@ class Roulette(Selector):
 
         """
 
-        if num_batches is None:
-            num_batches = float('inf')
-
         if fitness_modifier is None:
             fitness_modifier = self._get_fitness_values
 
@@ -131,27 +129,79 @@ class Roulette(Selector):
         )
 
     def _select_from_batches(self, batches, yielded_batches):
-        while (
-            batches and yielded_batches.get_num() < self._num_batches
-        ):
-            total = sum(batch.get_fitness_value() for batch in batches)
-            weights = [
-                batch.get_fitness_value() / total for batch in batches
-            ]
-            yield self._generator.choice(batches, p=weights)
-
-            if not self._duplicate_molecules:
-                batches = filter(
-                    yielded_batches.has_no_yielded_molecules,
-                    batches,
-                )
-            if not self._duplicate_batches:
-                batches = filter(
-                    yielded_batches.is_unyielded_batch,
-                    batches,
-                )
-            if (
-                not self._duplicate_molecules
-                or not self._duplicate_batches
-            ):
+        # islice handles a num_batches of None, meaning unlimited,
+        # without a comparison against the yield count on every
+        # iteration.
+        yield from it.islice(
+            self._select_batches(batches),
+            self._num_batches,
+        )
+
+    def _select_batches(self, batches):
+        # The weights depend only on the batches, so they need to be
+        # recomputed only when the batches get filtered, and never
+        # when duplicate selections are allowed.
+        needs_filtering = (
+            not self._duplicate_molecules
+            or not self._duplicate_batches
+        )
+        cumulative_weights = self._get_cumulative_weights(batches)
+        while batches:
+            # This is the same inverse transform sampling done by
+            # RandomState.choice, minus the re-validation and
+            # re-accumulation of the weights on every draw, so a
+            # given seed yields the same selections.
+            index = cumulative_weights.searchsorted(
+                self._generator.random_sample(),
+                side='right',
+            )
+            batch = batches[index]
+            yield batch
+
+            if needs_filtering:
+                # The surviving batches already passed the filters
+                # against every previously yielded batch, so each
+                # rebuild only needs to check them against the batch
+                # just yielded.
+                identity_key = batch.get_identity_key()
+                if not self._duplicate_molecules:
+                    yielded_keys = {
+                        key for key, count in identity_key
+                    }
+                    batches = (
+                        other
+                        for other in batches
+                        if yielded_keys.isdisjoint(
+                            key
+                            for key, count in other.get_identity_key()
+                        )
+                    )
+                if not self._duplicate_batches:
+                    batches = (
+                        other
+                        for other in batches
+                        if other.get_identity_key() != identity_key
+                    )
                 batches = tuple(batches)
+                cumulative_weights = (
+                    self._get_cumulative_weights(batches)
+                )
+
+    @staticmethod
+    def _get_cumulative_weights(batches):
+        # Summing and normalizing the array replaces two Python-level
+        # passes over the batches with vectorized reductions.
+        fitness_values = np.fromiter(
+            (batch.get_fitness_value() for batch in batches),
+            dtype=np.float64,
+            count=len(batches),
+        )
+        cumulative_weights = np.cumsum(
+            fitness_values / fitness_values.sum()
+        )
+        # RandomState.choice also renormalizes the cumulative
+        # distribution, keeping this makes the drawn indices
+        # bit-identical to it.
+        if len(cumulative_weights):
+            cumulative_weights /= cumulative_weights[-1]
+        return cumulative_weights
@@ -24,7 +24,7 @@ import logging
 import itertools as it
 
 from ..batch import Batch
-from .utilities import YieldedBatches
+from .utilities import CachedKeyMaker, YieldedBatches
 
 logger = logging.getLogger(__name__)
 
@@ -142,7 +142,7 @@ class Selector:
             excluded_batches=excluded_batches,
         ))
 
-        yielded_batches = YieldedBatches(self._key_maker)
+        yielded_batches = YieldedBatches()
         for batch in self._select_from_batches(
             batches=batches,
             yielded_batches=yielded_batches,
@@ -150,9 +150,12 @@ class Selector:
             yielded_batches.update(batch)
             yield batch
 
-        cls_name = self.__class__.__name__
+        # Lazy %-formatting avoids building the message when debug
+        # logging is off.
         logger.debug(
-            f'{cls_name} yielded {yielded_batches.get_num()} batches.'
+            '%s yielded %s batches.',
+            self.__class__.__name__,
+            yielded_batches.get_num(),
         )
 
     def _get_batches(
@@ -201,11 +204,31 @@ class Selector:
                 return False
             return batch.get_identity_key() in excluded_batches
 
+        # Hoist the attribute lookups out of the loop, which runs
+        # once per combination. The cache means each molecule has its
+        # key made only once, even though it can appear in many
+        # batches.
+        key_maker = CachedKeyMaker(self._key_maker)
+
+        # In the common case no batches are filtered, skip the
+        # predicate calls entirely.
+        if included_batches is None and excluded_batches is None:
+            for records in it.combinations(
+                population,
+                self._batch_size,
+            ):
+                yield Batch(
+                    records=records,
+                    fitness_values=fitness_values,
+                    key_maker=key_maker,
+                )
+            return
+
         for records in it.combinations(population, self._batch_size):
             batch = Batch(
                 records=records,
                 fitness_values=fitness_values,
-                key_maker=self._key_maker,
+                key_maker=key_maker,
             )
             if is_included(batch) and not is_excluded(batch):
                 yield batch
@@ -232,6 +255,38 @@ class Selector:
 
         raise NotImplementedError()
 
+    def _get_filtered_batches(self, batches, yielded_batches):
+        """
+        Get the batches which can still be yielded.
+
+        Parameters
+        ----------
+        batches : :class:`iterable` of :class:`.Batch`
+            The batches to filter.
+
+        yielded_batches : :class:`.YieldedBatches`
+            Keeps track of which batches have been yielded.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Batch`
+            The batches which pass the duplicate molecule and
+            duplicate batch filters.
+
+        """
+
+        if not self._duplicate_molecules:
+            batches = filter(
+                yielded_batches.has_no_yielded_molecules,
+                batches,
+            )
+        if not self._duplicate_batches:
+            batches = filter(
+                yielded_batches.is_unyielded_batch,
+                batches,
+            )
+        return tuple(batches)
+
     def _get_fitness_values(self, population):
         return {
             record: record.get_fitness_value() for record in population
@@ -113,6 +113,12 @@ class StochasticUniversalSampling(Selector):
 
     def _select_from_batches(self, batches, yielded_batches):
         batches = sorted(batches, reverse=True)
+        # Testing the duplicate flags once here keeps the attribute
+        # loads and branches out of the selection loop.
+        needs_filtering = (
+            not self._duplicate_molecules
+            or not self._duplicate_batches
+        )
 
         # SUS may need to run multiple rounds if duplicate_molecules or
         # duplicate_batches is False. This is because in each round
@@ -133,22 +139,14 @@ class StochasticUniversalSampling(Selector):
                 yielded_batches=yielded_batches,
             )
 
-            if yielded_batches.get_num() < self._num_batches:
-                if not self._duplicate_molecules:
-                    batches = filter(
-                        yielded_batches.has_no_yielded_molecules,
-                        batches,
-                    )
-                if not self._duplicate_batches:
-                    batches = filter(
-                        yielded_batches.is_unyielded_batch,
-                        batches,
-                    )
-                if (
-                    not self._duplicate_molecules
-                    or not self._duplicate_batches
-                ):
-                    batches = tuple(batches)
+            if (
+                needs_filtering
+                and yielded_batches.get_num() < self._num_batches
+            ):
+                batches = self._get_filtered_batches(
+                    batches=batches,
+                    yielded_batches=yielded_batches,
+                )
 
     def _select_with_stochastic_universal_sampling(
         self,
@@ -156,29 +154,37 @@ class StochasticUniversalSampling(Selector):
         yielded_batches,
     ):
 
-        total = sum(batch.get_fitness_value() for batch in batches)
-        batch_positions = []
-        batch_position = 0
-        for batch in batches:
-            batch_position += batch.get_fitness_value()/total
-            batch_positions.append(batch_position)
+        fitness_values = np.fromiter(
+            (batch.get_fitness_value() for batch in batches),
+            dtype=np.float64,
+            count=len(batches),
+        )
+        # The cumulative sum gives the end position of each batch
+        # along the line in a single vectorized pass.
+        batch_positions = np.cumsum(
+            fitness_values/fitness_values.sum()
+        )
 
         num_batches = min(
             self._num_batches - yielded_batches.get_num(),
             len(batches)
         )
         pointer_distance = 1/num_batches
-        pointers = []
-        pointer = self._generator.uniform(0, pointer_distance)
-        for i in range(num_batches):
-            pointers.append(pointer)
-            pointer += pointer_distance
-
-        batch_index = 0
-        for pointer in pointers:
-            while pointer > batch_positions[batch_index]:
-                batch_index += 1
+        pointers = (
+            self._generator.uniform(0, pointer_distance)
+            + pointer_distance*np.arange(num_batches)
+        )
 
+        # Each pointer lands on the first batch whose end position is
+        # not before it, which a single vectorized binary search finds
+        # for all pointers at once. The last position can fall
+        # slightly short of 1 due to rounding, so the indices are
+        # clipped to stay in range.
+        batch_indices = np.minimum(
+            np.searchsorted(batch_positions, pointers, side='left'),
+            len(batches) - 1,
+        )
+        for batch_index in batch_indices:
             batch = batches[batch_index]
 
             if (
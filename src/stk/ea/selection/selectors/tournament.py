@@ -5,6 +5,7 @@ Tournament
 """
 
 import numpy as np
+import itertools as it
 
 from stk.molecular import Inchi
 from .selector import Selector
@@ -94,9 +95,6 @@ class Tournament(Selector):
             fitness_modifier = self._get_fitness_values
 
         self._generator = np.random.RandomState(random_seed)
-        if num_batches is None:
-            num_batches = float('inf')
-
         self._duplicate_molecules = duplicate_molecules
         self._duplicate_batches = duplicate_batches
         self._batch_size = batch_size
@@ -107,35 +105,41 @@ class Tournament(Selector):
         )
 
     def _select_from_batches(self, batches, yielded_batches):
+        # islice handles a num_batches of None, meaning unlimited,
+        # without a comparison against the yield count on every
+        # iteration.
+        yield from it.islice(
+            self._select_batches(batches, yielded_batches),
+            self._num_batches,
+        )
+
+    def _select_batches(self, batches, yielded_batches):
+        # Testing the duplicate flags once here keeps the attribute
+        # loads and branches out of the selection loop.
+        needs_filtering = (
+            not self._duplicate_molecules
+            or not self._duplicate_batches
+        )
         # The tournament can only take place if there is more than 1
         # batch.
-        while (
-            len(batches) > 1
-            and yielded_batches.get_num() < self._num_batches
-        ):
+        while len(batches) > 1:
             tournament_size = self._generator.randint(
                 low=2,
                 high=len(batches)+1
             )
+            # Sampling indices avoids coercing the batches into a
+            # fresh object array on every tournament. The drawn
+            # indices are the same ones choice() would pick from the
+            # batches directly.
             competitors = self._generator.choice(
-                a=batches,
+                a=len(batches),
                 size=tournament_size,
                 replace=False
             )
-            yield max(competitors)
+            yield max(batches[index] for index in competitors)
 
-            if not self._duplicate_molecules:
-                batches = filter(
-                    yielded_batches.has_no_yielded_molecules,
-                    batches,
-                )
-            if not self._duplicate_batches:
-                batches = filter(
-                    yielded_batches.is_unyielded_batch,
-                    batches,
+            if needs_filtering:
+                batches = self._get_filtered_batches(
+                    batches=batches,
+                    yielded_batches=yielded_batches,
                 )
-            if (
-                not self._duplicate_molecules
-                or not self._duplicate_batches
-            ):
-                batches = tuple(batches)
@@ -1 +1,2 @@
+from .cached_key_maker import *  # noqa
 from .yielded_batches import *  # noqa
@@ -0,0 +1,55 @@
+"""
+Cached Key Maker
+================
+
+"""
+
+
+class CachedKeyMaker:
+    """
+    Caches the molecule keys made by another key maker.
+
+    Making a molecule key can be expensive, and during batch creation
+    the same molecule needs its key made once for every batch it is
+    a part of. Wrapping the key maker in a cache means each molecule
+    only has its key made once.
+
+    """
+
+    __slots__ = ('_key_maker', '_keys')
+
+    def __init__(self, key_maker):
+        """
+        Initialize a :class:`.CachedKeyMaker` instance.
+
+        Parameters
+        ----------
+        key_maker : :class:`.MoleculeKeyMaker`
+            The key maker whose keys are cached.
+
+        """
+
+        self._key_maker = key_maker
+        self._keys = {}
+
+    def get_key(self, molecule):
+        """
+        Get the key of `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule whose key is needed.
+
+        Returns
+        -------
+        :class:`object`
+            The key of `molecule`.
+
+        """
+
+        keys = self._keys
+        key = keys.get(molecule)
+        if key is None:
+            key = keys[molecule] = self._key_maker.get_key(molecule)
+        return key
@@ -11,12 +11,10 @@ class YieldedBatches:
 
     """
 
-    __slots__ = ('_molecules', '_batches', '_num', '_key_maker')
+    __slots__ = ('_molecules', '_batches', '_num')
 
-    def __init__(self, key_maker):
-        self._key_maker = key_maker
-
-        # Has all molecules yielded by select().
+    def __init__(self):
+        # Has the molecule keys of all molecules yielded by select().
         self._molecules = set()
         # Has the identity_key() of all batches yielded by select().
         self._batches = set()
@@ -39,9 +37,12 @@ class YieldedBatches:
 
         """
 
-        molecules = (record.get_molecule() for record in batch)
-        self._molecules.update(map(self._key_maker.get_key, molecules))
-        self._batches.add(batch.get_identity_key())
+        # The identity key of the batch already holds the key of
+        # every molecule in it, so the keys do not have to be
+        # recomputed here.
+        identity_key = batch.get_identity_key()
+        self._molecules.update(key for key, count in identity_key)
+        self._batches.add(identity_key)
         self._num += 1
         return self
 
@@ -112,9 +113,10 @@ class YieldedBatches:
 
         """
 
-        return any(
-            self._key_maker.get_key(molecule) in self._molecules
-            for molecule in (record.get_molecule() for record in batch)
+        # isdisjoint runs the membership tests in a single C-level
+        # loop, which also short-circuits on the first shared key.
+        return not self._molecules.isdisjoint(
+            key for key, count in batch.get_identity_key()
         )
 
     def has_no_yielded_molecules(self, batch):
@@ -134,7 +136,6 @@ class YieldedBatches:
 
         """
 
-        return all(
-            self._key_maker.get_key(molecule) not in self._molecules
-            for molecule in (record.get_molecule() for record in batch)
+        return self._molecules.isdisjoint(
+            key for key, count in batch.get_identity_key()
         )
@@ -5,6 +5,7 @@ Worst
 """
 
 import itertools as it
+from heapq import nsmallest
 
 from stk.molecular import Inchi
 from .selector import Selector
@@ -88,6 +89,18 @@ class Worst(Selector):
         )
 
     def _select_from_batches(self, batches, yielded_batches):
+        # If no batches get filtered out, only the worst num_batches
+        # ones can be yielded, and a bounded heap finds those without
+        # sorting every batch. nsmallest() is documented to be
+        # equivalent to sorted(batches)[:num_batches].
+        if (
+            self._num_batches is not None
+            and self._duplicate_molecules
+            and self._duplicate_batches
+        ):
+            yield from nsmallest(self._num_batches, batches)
+            return
+
         batches = sorted(batches)
 
         if not self._duplicate_molecules:
@@ -49,8 +49,14 @@ class Atom:
 
     """
 
-    # Maps each atomic number (int) to the relevant Atom subclass.
-    _elements = {}
+    # Atoms are created in very large numbers during construction,
+    # using __slots__ keeps them small.
+    __slots__ = ['_id', '_charge']
+
+    # Holds the Atom subclass of each element, indexed by atomic
+    # number. A list is used instead of a dict because indexing it
+    # is faster, and this lookup is done once per atom created.
+    _elements = []
 
     def __init_subclass__(cls, **kwargs):
         # Replace the default __init__() method of the subclass with
@@ -58,6 +64,10 @@ class Atom:
         # method takes an atomic_number parameter, but
         # _subclass_init() does not.
         cls.__init__ = cls._subclass_init
+        if cls._atomic_number >= len(cls._elements):
+            cls._elements.extend(
+                [None]*(cls._atomic_number+1-len(cls._elements))
+            )
         cls._elements[cls._atomic_number] = cls
 
     @staticmethod
@@ -94,6 +104,15 @@ class Atom:
 
         """
 
+        # Guard the lookup so that an invalid atomic number raises a
+        # KeyError, like a dict would, instead of wrapping around to
+        # another element or assigning a None __class__.
+        if (
+            atomic_number < 1
+            or atomic_number >= len(self._elements)
+            or self._elements[atomic_number] is None
+        ):
+            raise KeyError(atomic_number)
         self.__class__ = self._elements[atomic_number]
         self._id = id
         self._charge = charge
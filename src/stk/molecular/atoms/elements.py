@@ -10,474 +10,592 @@ from .atom import Atom
 
 
 class H(Atom):
+    __slots__ = []
     _atomic_number = 1
 
 
 class He(Atom):
+    __slots__ = []
     _atomic_number = 2
 
 
 class Li(Atom):
+    __slots__ = []
     _atomic_number = 3
 
 
 class Be(Atom):
+    __slots__ = []
     _atomic_number = 4
 
 
 class B(Atom):
+    __slots__ = []
     _atomic_number = 5
 
 
 class C(Atom):
+    __slots__ = []
     _atomic_number = 6
 
 
 class N(Atom):
+    __slots__ = []
     _atomic_number = 7
 
 
 # "O" is a valid elemental symbol.
 class O(Atom):  # noqa
+    __slots__ = []
     _atomic_number = 8
 
 
 class F(Atom):
+    __slots__ = []
     _atomic_number = 9
 
 
 class Ne(Atom):
+    __slots__ = []
     _atomic_number = 10
 
 
 class Na(Atom):
+    __slots__ = []
     _atomic_number = 11
 
 
 class Mg(Atom):
+    __slots__ = []
     _atomic_number = 12
 
 
 class Al(Atom):
+    __slots__ = []
     _atomic_number = 13
 
 
 class Si(Atom):
+    __slots__ = []
     _atomic_number = 14
 
 
 class P(Atom):
+    __slots__ = []
     _atomic_number = 15
 
 
 class S(Atom):
+    __slots__ = []
     _atomic_number = 16
 
 
 class Cl(Atom):
+    __slots__ = []
     _atomic_number = 17
 
 
 class Ar(Atom):
+    __slots__ = []
     _atomic_number = 18
 
 
 class K(Atom):
+    __slots__ = []
     _atomic_number = 19
 
 
 class Ca(Atom):
+    __slots__ = []
     _atomic_number = 20
 
 
 class Sc(Atom):
+    __slots__ = []
     _atomic_number = 21
 
 
 class Ti(Atom):
+    __slots__ = []
     _atomic_number = 22
 
 
 class V(Atom):
+    __slots__ = []
     _atomic_number = 23
 
 
 class Cr(Atom):
+    __slots__ = []
     _atomic_number = 24
 
 
 class Mn(Atom):
+    __slots__ = []
     _atomic_number = 25
 
 
 class Fe(Atom):
+    __slots__ = []
     _atomic_number = 26
 
 
 class Co(Atom):
+    __slots__ = []
     _atomic_number = 27
 
 
 class Ni(Atom):
+    __slots__ = []
     _atomic_number = 28
 
 
 class Cu(Atom):
+    __slots__ = []
     _atomic_number = 29
 
 
 class Zn(Atom):
+    __slots__ = []
     _atomic_number = 30
 
 
 class Ga(Atom):
+    __slots__ = []
     _atomic_number = 31
 
 
 class Ge(Atom):
+    __slots__ = []
     _atomic_number = 32
 
 
 class As(Atom):
+    __slots__ = []
     _atomic_number = 33
 
 
 class Se(Atom):
+    __slots__ = []
     _atomic_number = 34
 
 
 class Br(Atom):
+    __slots__ = []
     _atomic_number = 35
 
 
 class Kr(Atom):
+    __slots__ = []
     _atomic_number = 36
 
 
 class Rb(Atom):
+    __slots__ = []
     _atomic_number = 37
 
 
 class Sr(Atom):
+    __slots__ = []
     _atomic_number = 38
 
 
 class Y(Atom):
+    __slots__ = []
     _atomic_number = 39
 
 
 class Zr(Atom):
+    __slots__ = []
     _atomic_number = 40
 
 
 class Nb(Atom):
+    __slots__ = []
     _atomic_number = 41
 
 
 class Mo(Atom):
+    __slots__ = []
     _atomic_number = 42
 
 
 class Tc(Atom):
+    __slots__ = []
     _atomic_number = 43
 
 
 class Ru(Atom):
+    __slots__ = []
     _atomic_number = 44
 
 
 class Rh(Atom):
+    __slots__ = []
     _atomic_number = 45
 
 
 class Pd(Atom):
+    __slots__ = []
     _atomic_number = 46
 
 
 class Ag(Atom):
+    __slots__ = []
     _atomic_number = 47
 
 
 class Cd(Atom):
+    __slots__ = []
     _atomic_number = 48
 
 
 class In(Atom):
+    __slots__ = []
     _atomic_number = 49
 
 
 class Sn(Atom):
+    __slots__ = []
     _atomic_number = 50
 
 
 class Sb(Atom):
+    __slots__ = []
     _atomic_number = 51
 
 
 class Te(Atom):
+    __slots__ = []
     _atomic_number = 52
 
 
 # "I" is a valid elemental symbol.
 class I(Atom):  # noqa
+    __slots__ = []
     _atomic_number = 53
 
 
 class Xe(Atom):
+    __slots__ = []
     _atomic_number = 54
 
 
 class Cs(Atom):
+    __slots__ = []
     _atomic_number = 55
 
 
 class Ba(Atom):
+    __slots__ = []
     _atomic_number = 56
 
 
 class La(Atom):
+    __slots__ = []
     _atomic_number = 57
 
 
 class Ce(Atom):
+    __slots__ = []
     _atomic_number = 58
 
 
 class Pr(Atom):
+    __slots__ = []
     _atomic_number = 59
 
 
 class Nd(Atom):
+    __slots__ = []
     _atomic_number = 60
 
 
 class Pm(Atom):
+    __slots__ = []
     _atomic_number = 61
 
 
 class Sm(Atom):
+    __slots__ = []
     _atomic_number = 62
 
 
 class Eu(Atom):
+    __slots__ = []
     _atomic_number = 63
 
 
 class Gd(Atom):
+    __slots__ = []
     _atomic_number = 64
 
 
 class Tb(Atom):
+    __slots__ = []
     _atomic_number = 65
 
 
 class Dy(Atom):
+    __slots__ = []
     _atomic_number = 66
 
 
 class Ho(Atom):
+    __slots__ = []
     _atomic_number = 67
 
 
 class Er(Atom):
+    __slots__ = []
     _atomic_number = 68
 
 
 class Tm(Atom):
+    __slots__ = []
     _atomic_number = 69
 
 
 class Yb(Atom):
+    __slots__ = []
     _atomic_number = 70
 
 
 class Lu(Atom):
+    __slots__ = []
     _atomic_number = 71
 
 
 class Hf(Atom):
+    __slots__ = []
     _atomic_number = 72
 
 
 class Ta(Atom):
+    __slots__ = []
     _atomic_number = 73
 
 
 class W(Atom):
+    __slots__ = []
     _atomic_number = 74
 
 
 class Re(Atom):
+    __slots__ = []
     _atomic_number = 75
 
 
 class Os(Atom):
+    __slots__ = []
     _atomic_number = 76
 
 
 class Ir(Atom):
+    __slots__ = []
     _atomic_number = 77
 
 
 class Pt(Atom):
+    __slots__ = []
     _atomic_number = 78
 
 
 class Au(Atom):
+    __slots__ = []
     _atomic_number = 79
 
 
 class Hg(Atom):
+    __slots__ = []
     _atomic_number = 80
 
 
 class Tl(Atom):
+    __slots__ = []
     _atomic_number = 81
 
 
 class Pb(Atom):
+    __slots__ = []
     _atomic_number = 82
 
 
 class Bi(Atom):
+    __slots__ = []
     _atomic_number = 83
 
 
 class Po(Atom):
+    __slots__ = []
     _atomic_number = 84
 
 
 class At(Atom):
+    __slots__ = []
     _atomic_number = 85
 
 
 class Rn(Atom):
+    __slots__ = []
     _atomic_number = 86
 
 
 class Fr(Atom):
+    __slots__ = []
     _atomic_number = 87
 
 
 class Ra(Atom):
+    __slots__ = []
     _atomic_number = 88
 
 
 class Ac(Atom):
+    __slots__ = []
     _atomic_number = 89
 
 
 class Th(Atom):
+    __slots__ = []
     _atomic_number = 90
 
 
 class Pa(Atom):
+    __slots__ = []
     _atomic_number = 91
 
 
 class U(Atom):
+    __slots__ = []
     _atomic_number = 92
 
 
 class Np(Atom):
+    __slots__ = []
     _atomic_number = 93
 
 
 class Pu(Atom):
+    __slots__ = []
     _atomic_number = 94
 
 
 class Am(Atom):
+    __slots__ = []
     _atomic_number = 95
 
 
 class Cm(Atom):
+    __slots__ = []
     _atomic_number = 96
 
 
 class Bk(Atom):
+    __slots__ = []
     _atomic_number = 97
 
 
 class Cf(Atom):
+    __slots__ = []
     _atomic_number = 98
 
 
 class Es(Atom):
+    __slots__ = []
     _atomic_number = 99
 
 
 class Fm(Atom):
+    __slots__ = []
     _atomic_number = 100
 
 
 class Md(Atom):
+    __slots__ = []
     _atomic_number = 101
 
 
 class No(Atom):
+    __slots__ = []
     _atomic_number = 102
 
 
 class Lr(Atom):
+    __slots__ = []
     _atomic_number = 103
 
 
 class Rf(Atom):
+    __slots__ = []
     _atomic_number = 104
 
 
 class Db(Atom):
+    __slots__ = []
     _atomic_number = 105
 
 
 class Sg(Atom):
+    __slots__ = []
     _atomic_number = 106
 
 
 class Bh(Atom):
+    __slots__ = []
     _atomic_number = 107
 
 
 class Hs(Atom):
+    __slots__ = []
     _atomic_number = 108
 
 
 class Mt(Atom):
+    __slots__ = []
     _atomic_number = 109
 
 
 class Ds(Atom):
+    __slots__ = []
     _atomic_number = 110
 
 
 class Rg(Atom):
+    __slots__ = []
     _atomic_number = 111
 
 
 class Cn(Atom):
+    __slots__ = []
     _atomic_number = 112
 
 
 class Nh(Atom):
+    __slots__ = []
     _atomic_number = 113
 
 
 class Fl(Atom):
+    __slots__ = []
     _atomic_number = 114
 
 
 class Mc(Atom):
+    __slots__ = []
     _atomic_number = 115
 
 
 class Lv(Atom):
+    __slots__ = []
     _atomic_number = 116
 
 
 class Ts(Atom):
+    __slots__ = []
     _atomic_number = 117
 
 
 class Og(Atom):
+    __slots__ = []
     _atomic_number = 118
@@ -11,6 +11,10 @@ class Bond:
 
     """
 
+    # Bonds are created in very large numbers during construction,
+    # using __slots__ keeps them small.
+    __slots__ = ['_atom1', '_atom2', '_order', '_periodicity']
+
     def __init__(self, atom1, atom2, order, periodicity=(0, 0, 0)):
         """
         Initialize a :class:`Bond`.
@@ -10,13 +10,12 @@ Molecule
 
 """
 
+import math
 import os
 import numpy as np
-from scipy.spatial.distance import euclidean
 import rdkit.Chem.AllChem as rdkit
 
 from stk.utilities import (
-    vector_angle,
     rotation_matrix,
     rotation_matrix_arbitrary_axis,
 )
@@ -72,9 +71,10 @@ class Molecule:
 
         """
 
-        self._position_matrix = (
-            self._position_matrix.T + displacement
-        ).T
+        # The in-place, broadcast addition avoids allocating a
+        # displaced copy of the position matrix and the transpose
+        # round-trip.
+        self._position_matrix += np.asarray(displacement)[:, np.newaxis]
         return self
 
     def with_displacement(self, displacement):
@@ -102,16 +102,16 @@ class Molecule:
 
         """
 
-        # Set the origin of the rotation to "origin".
-        self._with_displacement(-origin)
         rot_mat = rotation_matrix_arbitrary_axis(angle, axis)
 
-        # Apply the rotation matrix on the position matrix, to get the
-        # new position matrix.
-        self._position_matrix = rot_mat @ self._position_matrix
-
-        # Return the centroid of the molecule to the original position.
-        self._with_displacement(origin)
+        # Shift the origin of the rotation to "origin", apply the
+        # rotation matrix and shift the origin back, all in a single
+        # fused expression. This avoids making two intermediate,
+        # displaced copies of the position matrix.
+        origin = np.asarray(origin)[:, np.newaxis]
+        self._position_matrix = (
+            rot_mat @ (self._position_matrix-origin) + origin
+        )
         return self
 
     def with_rotation_about_axis(self, angle, axis, origin):
@@ -153,16 +153,16 @@ class Molecule:
 
         """
 
-        # Set the origin of the rotation to "origin".
-        self._with_displacement(-origin)
         rot_mat = rotation_matrix(start, target)
 
-        # Apply the rotation matrix to the atomic positions to yield
-        # the new atomic positions.
-        self._position_matrix = rot_mat @ self._position_matrix
-
-        # Restore original position.
-        self._with_displacement(origin)
+        # Shift the origin of the rotation to "origin", apply the
+        # rotation matrix and shift the origin back, all in a single
+        # fused expression. This avoids making two intermediate,
+        # displaced copies of the position matrix.
+        origin = np.asarray(origin)[:, np.newaxis]
+        self._position_matrix = (
+            rot_mat @ (self._position_matrix-origin) + origin
+        )
         return self
 
     def with_rotation_between_vectors(self, start, target, origin):
@@ -279,8 +279,6 @@ class Molecule:
                 'possible to calculate an angle.'
             )
 
-        self._with_displacement(-origin)
-
         # 1. Remove any component of the start and target vectors long
         # the axis. This puts them both on the same plane.
         # 2. Calculate the angle between them.
@@ -289,24 +287,31 @@ class Molecule:
 
         # If `tstart` is 0, it is parallel to the rotation axis, stop.
         if np.allclose(tstart, [0, 0, 0], 1e-8):
-            self._with_displacement(origin)
             return self
 
         tend = target - np.dot(target, axis)*axis
         # If `tend` is 0, it is parallel to the rotation axis, stop.
         if np.allclose(tend, [0, 0, 0], 1e-8):
-            self._with_displacement(origin)
             return self
 
-        angle = vector_angle(tstart, tend)
-
-        projection = tstart @ np.cross(axis, tend)
-        if projection > 0:
-            angle = 2*np.pi - angle
+        # The signed angle from tstart to tend about the axis, taken
+        # directly from atan2. This replaces an acos call followed by
+        # a projection test to fix the sign.
+        angle = math.atan2(
+            np.cross(tstart, tend) @ axis,
+            tstart @ tend,
+        )
 
         rotation_matrix = rotation_matrix_arbitrary_axis(angle, axis)
-        self._position_matrix = rotation_matrix @ self._position_matrix
-        self._with_displacement(origin)
+
+        # Shift the origin of the rotation to "origin", apply the
+        # rotation matrix and shift the origin back, all in a single
+        # fused expression. This avoids making two intermediate,
+        # displaced copies of the position matrix.
+        origin = np.asarray(origin)[:, np.newaxis]
+        self._position_matrix = (
+            rotation_matrix @ (self._position_matrix-origin) + origin
+        )
         return self
 
     def with_rotation_to_minimize_angle(
@@ -375,12 +380,11 @@ class Molecule:
         """
 
         clone = self.__class__.__new__(self.__class__)
-        Molecule.__init__(
-            self=clone,
-            atoms=self._atoms,
-            bonds=self._bonds,
-            position_matrix=self._position_matrix.T,
-        )
+        clone._atoms = self._atoms
+        clone._bonds = self._bonds
+        # Copy the position matrix directly, instead of round-tripping
+        # it through the transpose done by __init__.
+        clone._position_matrix = np.array(self._position_matrix)
         return clone
 
     def get_atomic_positions(self, atom_ids=None):
@@ -513,9 +517,9 @@ class Molecule:
         if len(atom_ids) == 0:
             raise ValueError('atom_ids was of length 0.')
 
-        return np.divide(
-            self._position_matrix[:, atom_ids].sum(axis=1),
-            len(atom_ids)
+        return (
+            self._position_matrix[:, atom_ids].sum(axis=1)
+            / len(atom_ids)
         )
 
     def get_direction(self, atom_ids=None):
@@ -592,7 +596,8 @@ class Molecule:
             raise ValueError('atom_ids was of length 0.')
 
         coords = self._position_matrix[:, atom_ids]
-        return float(euclidean(coords.min(axis=1), coords.max(axis=1)))
+        diameter = coords.max(axis=1) - coords.min(axis=1)
+        return float(np.sqrt(diameter @ diameter))
 
     def get_plane_normal(self, atom_ids=None):
         """
@@ -628,8 +633,11 @@ class Molecule:
         if len(atom_ids) == 0:
             raise ValueError('atom_ids was of length 0.')
 
+        # Compute the centroid from the already gathered positions,
+        # instead of indexing the position matrix a second time
+        # through get_centroid().
         pos = self._position_matrix[:, atom_ids].T
-        centroid = self.get_centroid(atom_ids)
+        centroid = pos.sum(axis=0) / len(atom_ids)
         return np.linalg.svd(pos - centroid)[-1][2, :]
 
     def get_position_matrix(self):
@@ -683,7 +691,13 @@ class Molecule:
 
         """
 
-        self._position_matrix = np.array(position_matrix.T)
+        # Coerce to float64, like __init__ does, so that in-place
+        # modifications of the position matrix are safe even when the
+        # caller provides an integer matrix.
+        self._position_matrix = np.array(
+            position_matrix.T,
+            dtype=np.float64,
+        )
         return self
 
     def with_position_matrix(self, position_matrix):
@@ -819,10 +833,8 @@ class Molecule:
         old_ids = {
             atom.get_id(): old_id for old_id, atom in atom_map.items()
         }
-        self._position_matrix = np.array(np.array([
-            self._position_matrix.T[old_ids[new_id]]
-            for new_id in range(len(self._atoms))
-        ]).T)
+        order = [old_ids[new_id] for new_id in range(len(self._atoms))]
+        self._position_matrix = self._position_matrix[:, order]
         return self
 
     def write(self, path, atom_ids=None):
@@ -1,3 +1,5 @@
+import numpy as np
+
 from stk.utilities import periodic_table
 
 
@@ -53,7 +55,7 @@ def _with_structure_from_turbomole(self, path):
                 f'Atom {i} element does not match file.'
             )
 
-        new_coords.append([float(i)*bohr_to_ang for i in coords])
+        new_coords.append(coords)
 
     # Check that the correct number of atom
     # lines was present in the file.
@@ -64,5 +66,8 @@ def _with_structure_from_turbomole(self, path):
             f'in the molecule, {num_atoms}.'
         )
 
-    # Update the structure.
+    # Update the structure. The coordinates are converted from
+    # strings and scaled in a single vectorized pass, instead of one
+    # float() call per coordinate.
+    new_coords = np.array(new_coords, dtype=np.float64)*bohr_to_ang
     return self._with_position_matrix(new_coords)
@@ -53,7 +53,7 @@ def _with_structure_from_xyz(self, path):
                 f'Atom {i} element does not match file.'
             )
 
-        new_coords.append([float(i) for i in coords])
+        new_coords.append(coords)
 
     # Check that the correct number of atom
     # lines was present in the file.
@@ -64,6 +64,8 @@ def _with_structure_from_xyz(self, path):
             f'molecule, {num_atoms}.'
         )
 
-    # Update the structure.
-    new_coords = np.array(new_coords)
+    # Update the structure. The coordinates are converted from
+    # strings in a single vectorized pass, instead of one float()
+    # call per coordinate.
+    new_coords = np.array(new_coords, dtype=np.float64)
     return self._with_position_matrix(new_coords)
@@ -48,13 +48,16 @@ def _to_mdl_mol_block(self, atom_ids=None):
     elif isinstance(atom_ids, int):
         atom_ids = (atom_ids, )
 
+    # Convert the coordinates into plain floats once, instead of
+    # slicing the position matrix for every atom.
+    coords = self._position_matrix.T.tolist()
     atom_lines = []
     # This set gets used by bonds.
     id_map = {}
     for new_atom_id, old_atom_id in enumerate(atom_ids, 1):
         id_map[old_atom_id] = new_atom_id
 
-        x, y, z = self._position_matrix[:, old_atom_id]
+        x, y, z = coords[old_atom_id]
         atom = self._atoms[old_atom_id]
         symbol = atom.__class__.__name__
         charge = atom.get_charge()
@@ -37,26 +37,29 @@ def _write_pdb_file(self, path, atom_ids):
     occupancy = '1.00'
     temp_factor = '0.00'
 
-    coords = self._position_matrix
+    # Convert the coordinates into plain floats once, instead of
+    # slicing the position matrix for every atom.
+    coords = self._position_matrix.T.tolist()
     # This set will be used by bonds.
     atoms = set()
     for atom in atom_ids:
         atoms.add(atom)
 
         serial = atom+1
-        element = self._atoms[atom].__class__.__name__
+        atom_ = self._atoms[atom]
+        element = atom_.__class__.__name__
         atom_counts[element] = atom_counts.get(element, 0) + 1
         name = f'{element}{atom_counts[element]}'
         # Make sure the coords are no more than 8 columns wide
         # each.
-        x, y, z = (i for i in coords[:, atom])
+        x, y, z = coords[atom]
         lines.append(
             f'{hetatm:<6}{serial:>5} {name:<4}'
             f'{alt_loc:<1}{res_name:<3} {chain_id:<1}'
             f'{res_seq:>4}{i_code:<1}   '
             f' {x:>7.3f} {y:>7.3f} {z:>7.3f}'
             f'{occupancy:>6}{temp_factor:>6}          '
-            f'{element:>2}{self._atoms[atom].get_charge():>2}\n'
+            f'{element:>2}{atom_.get_charge():>2}\n'
         )
 
     conect = 'CONECT'
@@ -26,10 +26,14 @@ def _write_xyz_file(self, path, atom_ids):
     elif isinstance(atom_ids, int):
         atom_ids = (atom_ids, )
 
+    # Convert the coordinates into plain floats once, instead of
+    # slicing the position matrix for every atom.
+    coords = self._position_matrix.T.tolist()
+    atoms = self._atoms
     content = [0]
     for i, atom_id in enumerate(atom_ids, 1):
-        x, y, z = self._position_matrix[:, atom_id]
-        symbol = self._atoms[atom_id].__class__.__name__
+        x, y, z = coords[atom_id]
+        symbol = atoms[atom_id].__class__.__name__
         content.append(f'{symbol} {x:f} {y:f} {z:f}\n')
     # Set first line to the atom_count.
     content[0] = f'{i}\n\n'
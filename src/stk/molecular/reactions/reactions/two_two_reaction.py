@@ -5,7 +5,7 @@ Two-Two Reaction
 """
 
 import itertools as it
-from scipy.spatial.distance import euclidean
+import numpy as np
 
 from .reaction import Reaction
 from ...bonds import Bond
@@ -73,13 +73,22 @@ class TwoTwoReaction(Reaction):
             )
 
     def _get_bonder_pairs(self):
-        pairs = it.product(
+        pairs = tuple(it.product(
             self._functional_group1.get_bonders(),
             self._functional_group2.get_bonders(),
-        )
-        sorted_pairs = sorted(pairs, key=self._pair_distance)
+        ))
+        # Compute all pair distances in a single vectorized pass,
+        # instead of calling scipy once per pair during the sort.
+        positions1 = self._position_matrix[
+            [bonder1.get_id() for bonder1, bonder2 in pairs]
+        ]
+        positions2 = self._position_matrix[
+            [bonder2.get_id() for bonder1, bonder2 in pairs]
+        ]
+        distances = np.linalg.norm(positions1-positions2, axis=1)
         bonded = set()
-        for bonder1, bonder2 in sorted_pairs:
+        for index in np.argsort(distances, kind='stable'):
+            bonder1, bonder2 = pairs[index]
             if (
                 bonder1.get_id() not in bonded
                 and bonder2.get_id() not in bonded
@@ -88,13 +97,6 @@ class TwoTwoReaction(Reaction):
                 bonded.add(bonder2.get_id())
                 yield bonder1, bonder2
 
-    def _pair_distance(self, bonders):
-        bonder1, bonder2 = bonders
-        return euclidean(
-            self._position_matrix[bonder1.get_id()],
-            self._position_matrix[bonder2.get_id()],
-        )
-
     def _get_deleted_atoms(self):
         yield from self._functional_group1.get_deleters()
         yield from self._functional_group2.get_deleters()
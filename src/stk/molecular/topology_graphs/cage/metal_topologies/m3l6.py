@@ -34,82 +34,78 @@ class M3L6(Cage):
 
     _R, _theta = 1, 0
 
+    # Several vertices share an angle, so compute the x and y
+    # coordinates of each angle just once.
+    _xy0 = (_R*np.cos(_theta), _R*np.sin(_theta))
+    _xy1 = (
+        _R*np.cos(_theta+(4*np.pi/3)),
+        _R*np.sin(_theta+(4*np.pi/3)),
+    )
+    _xy2 = (
+        _R*np.cos(_theta+(2*np.pi/3)),
+        _R*np.sin(_theta+(2*np.pi/3)),
+    )
+    _xy3 = (
+        _R*np.cos((_theta+np.pi/4)),
+        _R*np.sin((_theta+np.pi/4)),
+    )
+    _xy4 = (
+        _R*np.cos((_theta+1*np.pi/3)),
+        _R*np.sin((_theta+1*np.pi/3)),
+    )
+    _xy5 = (
+        _R*np.cos((_theta+1*np.pi/3)+(4*np.pi/3)),
+        _R*np.sin((_theta+1*np.pi/3)+(4*np.pi/3)),
+    )
+    _xy6 = (
+        _R*np.cos((_theta+1*np.pi/3)+(2*np.pi/3)),
+        _R*np.sin((_theta+1*np.pi/3)+(2*np.pi/3)),
+    )
+
     _vertex_prototypes = (
         _NonLinearCageVertex(
             id=0,
-            position=[_R*np.cos(_theta), _R*np.sin(_theta), 0]
+            position=[*_xy0, 0]
         ),
         _NonLinearCageVertex(
             id=1,
-            position=[
-                _R*np.cos(_theta+(4*np.pi/3)),
-                _R*np.sin(_theta+(4*np.pi/3)),
-                0
-            ]
+            position=[*_xy1, 0]
         ),
         _NonLinearCageVertex(
             id=2,
-            position=[
-                _R*np.cos(_theta+(2*np.pi/3)),
-                _R*np.sin(_theta+(2*np.pi/3)),
-                0
-            ]
+            position=[*_xy2, 0]
         ),
 
         _LinearCageVertex(
             id=3,
-            position=[
-                _R*np.cos((_theta+np.pi/4)),
-                _R*np.sin((_theta+np.pi/4)),
-                0.5
-            ],
+            position=[*_xy3, 0.5],
             use_neighbor_placement=False
         ),
         _LinearCageVertex(
             id=4,
-            position=[
-                _R*np.cos((_theta+1*np.pi/3)),
-                _R*np.sin((_theta+1*np.pi/3)),
-                -0.5
-            ],
+            position=[*_xy4, -0.5],
             use_neighbor_placement=False
         ),
 
         _LinearCageVertex(
             id=5,
-            position=[
-                _R*np.cos((_theta+1*np.pi/3)+(4*np.pi/3)),
-                _R*np.sin((_theta+1*np.pi/3)+(4*np.pi/3)),
-                0.5
-            ],
+            position=[*_xy5, 0.5],
             use_neighbor_placement=False
         ),
         _LinearCageVertex(
             id=6,
-            position=[
-                _R*np.cos((_theta+1*np.pi/3)+(4*np.pi/3)),
-                _R*np.sin((_theta+1*np.pi/3)+(4*np.pi/3)),
-                -0.5
-            ],
+            position=[*_xy5, -0.5],
             use_neighbor_placement=False
         ),
 
         _LinearCageVertex(
             id=7,
-            position=[
-                _R*np.cos((_theta+1*np.pi/3)+(2*np.pi/3)),
-                _R*np.sin((_theta+1*np.pi/3)+(2*np.pi/3)),
-                0.5
-            ],
+            position=[*_xy6, 0.5],
             use_neighbor_placement=False
         ),
         _LinearCageVertex(
             id=8,
-            position=[
-                _R*np.cos((_theta+1*np.pi/3)+(2*np.pi/3)),
-                _R*np.sin((_theta+1*np.pi/3)+(2*np.pi/3)),
-                -0.5
-            ],
+            position=[*_xy6, -0.5],
             use_neighbor_placement=False
         ),
     )
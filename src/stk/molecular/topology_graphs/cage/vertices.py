@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.spatial.distance import euclidean
 
 from stk.utilities import (
     get_acute_vector,
@@ -166,10 +165,13 @@ class _LinearCageVertex(_CageVertex):
                 building_block.get_functional_groups()
             ).get_placer_ids(),
         )
-        edge_position = edges[self._aligner_edge].get_position()
-        edge_centroid = (
-            sum(edge.get_position() for edge in edges) / len(edges)
-        )
+        # Gather the edge positions once, instead of summing copies
+        # made by get_position() in a Python loop.
+        edge_positions = np.array([
+            edge.get_position() for edge in edges
+        ])
+        edge_position = edge_positions[self._aligner_edge]
+        edge_centroid = edge_positions.sum(axis=0) / len(edges)
         building_block = building_block.with_rotation_between_vectors(
             start=fg_centroid - self._position,
             target=edge_position - edge_centroid,
@@ -182,7 +184,7 @@ class _LinearCageVertex(_CageVertex):
             start=core_centroid - self._position,
             target=self._position,
             axis=normalize_vector(
-                edges[0].get_position() - edges[1].get_position()
+                edge_positions[0] - edge_positions[1]
             ),
             origin=self._position,
         ).get_position_matrix()
@@ -190,13 +192,16 @@ class _LinearCageVertex(_CageVertex):
     def map_functional_groups_to_edges(self, building_block, edges):
         fg, = building_block.get_functional_groups(0)
         fg_position = building_block.get_centroid(fg.get_placer_ids())
-
-        def fg_distance(edge):
-            return euclidean(edge.get_position(), fg_position)
-
-        edges = sorted(edges, key=fg_distance)
+        # Compute the distance of every edge to the functional group
+        # in a single vectorized pass.
+        edge_positions = np.array([
+            edge.get_position() for edge in edges
+        ])
+        distances = np.linalg.norm(edge_positions-fg_position, axis=1)
         return {
-            fg_id: edge.get_id() for fg_id, edge in enumerate(edges)
+            fg_id: edges[edge_index].get_id()
+            for fg_id, edge_index
+            in enumerate(np.argsort(distances, kind='stable'))
         }
 
 
@@ -213,16 +218,15 @@ class _NonLinearCageVertex(_CageVertex):
             position=self._position,
             atom_ids=building_block.get_placer_ids(),
         )
-        edge_centroid = (
-            sum(edge.get_position() for edge in edges) / len(edges)
-        )
+        # Gather the edge positions once and derive both the centroid
+        # and the plane normal from the same array.
+        edge_positions = np.array([
+            edge.get_position() for edge in edges
+        ])
+        edge_centroid = edge_positions.sum(axis=0) / len(edges)
         edge_normal = get_acute_vector(
             reference=edge_centroid,
-            vector=get_plane_normal(
-                points=np.array([
-                    edge.get_position() for edge in edges
-                ]),
-            ),
+            vector=get_plane_normal(points=edge_positions),
         )
         core_centroid = building_block.get_centroid(
             atom_ids=building_block.get_core_atom_ids(),
@@ -429,21 +429,24 @@ class Cof(TopologyGraph):
             ]
             for _ in xdim
         ]
-        # Make a clone of each vertex for each unit cell.
-        cells = it.product(xdim, ydim, zdim)
-        vertices = it.product(cells, self._vertex_prototypes)
-        for id_, (cell, vertex) in enumerate(vertices):
+        # Make a clone of each vertex for each unit cell. The shift is
+        # the same for every vertex in a unit cell, so it is computed
+        # once per cell, rather than once per vertex.
+        id_ = 0
+        for cell in it.product(xdim, ydim, zdim):
             x, y, z = cell
             shift = sum(
                 axis * dim
                 for axis, dim in zip(cell, self._lattice_constants)
             )
-            lattice[x][y][z][vertex.get_id()] = vertex.__class__(
-                id=id_,
-                position=vertex.get_position() + shift,
-                aligner_edge=vertex_alignments.get(id_, 0),
-                cell=cell,
-            )
+            for vertex in self._vertex_prototypes:
+                lattice[x][y][z][vertex.get_id()] = vertex.__class__(
+                    id=id_,
+                    position=vertex.get_position() + shift,
+                    aligner_edge=vertex_alignments.get(id_, 0),
+                    cell=cell,
+                )
+                id_ += 1
         return lattice
 
     def _get_edges(self, lattice):
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.spatial.distance import euclidean
 from stk.utilities import (
     get_acute_vector,
     normalize_vector,
@@ -148,10 +147,7 @@ class _CofVertex(Vertex):
             )
             positions.append(vertex.get_position() + shift)
 
-        position = np.divide(
-            np.sum(positions, axis=0),
-            len(positions),
-        )
+        position = np.sum(positions, axis=0) / len(positions)
         return cls(id, position, aligner_edge, cell)
 
     def clone(self):
@@ -206,7 +202,10 @@ class _LinearCofVertex(_CofVertex):
         fg_position = building_block.get_centroid(fg.get_placer_ids())
 
         def fg_distance(edge):
-            return euclidean(edge.get_position(), fg_position)
+            # The squared distance is enough for ordering and avoids
+            # a scipy call per edge.
+            displacement = edge.get_position() - fg_position
+            return displacement @ displacement
 
         edges = sorted(edges, key=fg_distance)
         return {
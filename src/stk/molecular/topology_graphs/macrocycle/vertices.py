@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.spatial.distance import euclidean
 
 from ..topology_graph import Vertex
 
@@ -92,7 +91,10 @@ class _CycleVertex(Vertex):
         )
 
         def fg0_distance(edge):
-            return euclidean(edge.get_position(), fg0_position)
+            # The squared distance is enough for ordering and avoids
+            # a scipy call per edge.
+            displacement = edge.get_position() - fg0_position
+            return displacement @ displacement
 
         edge0 = min(edges, key=fg0_distance)
         return {
@@ -1,5 +1,3 @@
-from scipy.spatial.distance import euclidean
-
 from stk.utilities import get_projection
 
 from ..topology_graph import Vertex
@@ -133,7 +131,10 @@ class _BiDentateLigandVertex(Vertex):
         fg_position = building_block.get_centroid(fg.get_placer_ids())
 
         def fg_distance(edge):
-            return euclidean(edge.get_position(), fg_position)
+            # The squared distance is enough for ordering and avoids
+            # a scipy call per edge.
+            displacement = edge.get_position() - fg_position
+            return displacement @ displacement
 
         edges = sorted(edges, key=fg_distance)
         return {
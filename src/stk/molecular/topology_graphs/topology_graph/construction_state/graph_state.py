@@ -13,6 +13,7 @@ class _GraphState:
         '_vertices',
         '_edges',
         '_lattice_constants',
+        '_lattice',
         '_vertex_edges',
     ]
 
@@ -55,6 +56,12 @@ class _GraphState:
         }
         self._edges = edges
         self._lattice_constants = lattice_constants
+        # Stacking the lattice constants into a matrix means periodic
+        # edge shifts are a single matrix product, instead of a
+        # Python-level sum of scaled lattice vectors per edge.
+        self._lattice = (
+            np.array(lattice_constants) if lattice_constants else None
+        )
         self._vertex_edges = self._get_vertex_edges()
 
     def _get_vertex_edges(self):
@@ -122,13 +129,7 @@ class _GraphState:
         end_cell = vertex1.get_cell() + direction*periodicity
         cell_shift = end_cell - vertex2.get_cell()
 
-        shift = sum(
-            axis_shift*constant
-            for axis_shift, constant in zip(
-                cell_shift,
-                self._lattice_constants,
-            )
-        )
+        shift = cell_shift @ self._lattice
         position = (
             (vertex2.get_position()+shift+vertex1.get_position()) / 2
         )
@@ -63,14 +63,16 @@ class _DeletionsSummary:
         self._atom_infos = tuple(atom_infos)
         self._bonds = tuple(bonds)
         self._bond_infos = tuple(bond_infos)
-        self._position_matrix = np.array(position_matrix)
+        # The position matrix is only read, never modified, so a
+        # defensive copy is not needed.
+        self._position_matrix = np.asarray(position_matrix)
         self._deleted_ids = set(deleted_ids)
 
         self._valid_atoms = []
         self._valid_atom_infos = []
         self._valid_bonds = []
         self._valid_bond_infos = []
-        self._valid_positions = []
+        self._valid_positions = None
         self._with_valid_data()
 
     def _with_valid_data(self):
@@ -93,7 +95,7 @@ class _DeletionsSummary:
 
         valid_atoms = self._valid_atoms
         valid_atom_infos = self._valid_atom_infos
-        valid_positions = self._valid_positions
+        valid_ids = []
         atom_map = {}
 
         def with_atom(atom):
@@ -108,10 +110,13 @@ class _DeletionsSummary:
                     building_block_id=info.get_building_block_id(),
                 )
             )
-            valid_positions.append(position_matrix[atom_id])
+            valid_ids.append(atom_id)
 
         for atom in filter(valid_atom, atoms):
             with_atom(atom)
+        # Gather the positions of the remaining atoms with a single
+        # fancy index, instead of collecting row views one by one.
+        self._valid_positions = position_matrix[valid_ids]
 
         def valid_bond(bond_data):
             index, bond = bond_data
@@ -203,3 +208,18 @@ class _DeletionsSummary:
         """
 
         yield from self._valid_positions
+
+    def get_position_matrix(self):
+        """
+        Get the position matrix of atoms held by the summary.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The position matrix of the atoms held by the summary.
+
+        """
+
+        # The matrix is already a fresh array made by the summary, so
+        # it can be handed to the caller without a copy.
+        return self._valid_positions
@@ -85,7 +85,7 @@ class _MoleculeState:
         self._bond_infos.extend(summary.get_bond_infos())
         self._position_matrix = np.concatenate([
             self._position_matrix,
-            summary.get_position_matrix(),
+            *summary.get_position_matrices(),
         ])
         for edge_id, functional_groups in (
             summary.get_edge_functional_groups()
@@ -313,5 +313,5 @@ class _MoleculeState:
         self._atom_infos = list(summary.get_atom_infos())
         self._bonds = list(summary.get_bonds())
         self._bond_infos = list(summary.get_bond_infos())
-        self._position_matrix = np.array(list(summary.get_positions()))
+        self._position_matrix = summary.get_position_matrix()
         return self
@@ -1,4 +1,3 @@
-import numpy as np
 from collections import defaultdict
 
 from .atom_batch import _AtomBatch
@@ -244,18 +243,22 @@ class _PlacementsSummary:
 
         yield from self._bond_infos
 
-    def get_position_matrix(self):
+    def get_position_matrices(self):
         """
-        Get a position matrix for the atoms in the summary.
+        Yield the position matrices of the placement results.
 
-        Returns
-        -------
+        Yielding the individual matrices, instead of stacking them
+        into a single one, lets the caller combine them with its own
+        position matrix in a single allocation.
+
+        Yields
+        ------
         :class:`numpy.ndarray`
-            The position matrix.
+            A position matrix.
 
         """
 
-        return np.vstack(self._position_matrices)
+        yield from self._position_matrices
 
     def get_edge_functional_groups(self):
         """
@@ -3,6 +3,12 @@ import pathos
 from .utilities import _Placement
 
 
+def _get_result(placement):
+    # A module level function is used instead of a lambda, because
+    # it is cheaper for the process pool to serialize.
+    return placement.get_result()
+
+
 class _Parallel:
     """
     Holds parallel implementations of topology graph methods.
@@ -43,10 +49,7 @@ class _Parallel:
                     edges,
                     building_blocks,
                 )
-                placement_results = pool.map(
-                    lambda placement: placement.get_result(),
-                    placements,
-                )
+                placement_results = pool.map(_get_result, placements)
                 state = state.with_placement_results(
                     vertices=vertices,
                     edges=edges,
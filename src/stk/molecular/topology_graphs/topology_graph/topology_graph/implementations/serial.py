@@ -37,7 +37,7 @@ class _Serial:
                 building_blocks,
             )
             placement_results = map(
-                lambda placement: placement.get_result(),
+                _Placement.get_result,
                 placements,
             )
             state = state.with_placement_results(
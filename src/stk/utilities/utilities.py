@@ -8,6 +8,7 @@ part of ``stk``. They must be completely self-sufficient.
 
 import rdkit.Chem.AllChem as rdkit
 from rdkit.Geometry import Point3D
+import math
 import numpy as np
 import time
 from contextlib import contextmanager
@@ -198,11 +199,18 @@ def dedupe(iterable, key=None, seen=None):
 
     if seen is None:
         seen = set()
-    for x in iterable:
-        val = key(x) if key is not None else x
-        if val not in seen:
-            seen.add(val)
-            yield x
+    add = seen.add
+    if key is None:
+        for x in iterable:
+            if x not in seen:
+                add(x)
+                yield x
+    else:
+        for x in iterable:
+            val = key(x)
+            if val not in seen:
+                add(val)
+                yield x
 
 
 def flatten(iterable, excluded_types=None):
@@ -250,11 +258,22 @@ def flatten(iterable, excluded_types=None):
     if excluded_types is None:
         excluded_types = {str}
 
-    for x in iterable:
-        if hasattr(x, '__iter__') and type(x) not in excluded_types:
-            yield from flatten(x, excluded_types)
+    # An explicit stack is used instead of recursion, so that deeply
+    # nested iterables do not pay for a chain of generator frames on
+    # every yielded element.
+    stack = [iter(iterable)]
+    while stack:
+        for x in stack[-1]:
+            if (
+                hasattr(x, '__iter__')
+                and type(x) not in excluded_types
+            ):
+                stack.append(iter(x))
+                break
+            else:
+                yield x
         else:
-            yield x
+            stack.pop()
 
 
 def kabsch(coords1, coords2):
@@ -363,6 +382,19 @@ def mol_from_mae_file(mae_path):
     data_block = [a.split() for a in data_block.split('\n') if
                   not a.isspace() and a != '']
 
+    # Find the column holding each property once, instead of
+    # scanning every label for every atom line.
+    columns = {}
+    for index, label in enumerate(labels):
+        if 'x_coord' in label:
+            columns['x'] = index
+        if 'y_coord' in label:
+            columns['y'] = index
+        if 'z_coord' in label:
+            columns['z'] = index
+        if 'atomic_number' in label:
+            columns['atom_num'] = index
+
     for line in data_block:
         line = [word for word in line if word != '"']
         if len(labels) != len(line):
@@ -370,16 +402,10 @@ def mol_from_mae_file(mae_path):
                                 ' not match number of columns'
                                 ' in .mae file.'))
 
-        for label, data in zip(labels, line):
-            if 'x_coord' in label:
-                x = float(data)
-            if 'y_coord' in label:
-                y = float(data)
-            if 'z_coord' in label:
-                z = float(data)
-            if 'atomic_number' in label:
-                atom_num = int(data)
-
+        x = float(line[columns['x']])
+        y = float(line[columns['y']])
+        z = float(line[columns['z']])
+        atom_num = int(line[columns['atom_num']])
         atom_sym = periodic_table[atom_num]
         atom_coord = Point3D(x, y, z)
         atom_id = mol.AddAtom(rdkit.Atom(atom_sym))
@@ -391,19 +417,24 @@ def mol_from_mae_file(mae_path):
     data_block = [a.split() for a in data_block.split('\n')
                   if not a.isspace() and a != '']
 
+    columns = {}
+    for index, label in enumerate(labels):
+        if 'from' in label:
+            columns['from'] = index
+        if 'to' in label:
+            columns['to'] = index
+        if 'order' in label:
+            columns['order'] = index
+
     for line in data_block:
         if len(labels) != len(line):
             raise RuntimeError(('Number of labels does'
                                 ' not match number of '
                                 'columns in .mae file.'))
 
-        for label, data in zip(labels, line):
-            if 'from' in label:
-                atom1 = int(data) - 1
-            if 'to' in label:
-                atom2 = int(data) - 1
-            if 'order' in label:
-                bond_order = str(int(data))
+        atom1 = int(line[columns['from']]) - 1
+        atom2 = int(line[columns['to']]) - 1
+        bond_order = str(int(line[columns['order']]))
         mol.AddBond(atom1, atom2, bond_dict[bond_order])
 
     mol = mol.GetMol()
@@ -429,7 +460,7 @@ def normalize_vector(vector):
 
     """
 
-    return np.divide(vector, np.linalg.norm(vector))
+    return vector / np.linalg.norm(vector)
 
 
 def remake(mol):
@@ -525,23 +556,27 @@ def rotation_matrix(vector1, vector2):
         return np.identity(3)
 
     # Handle the case where the rotation is 180 degrees.
-    if np.allclose(vector1, np.multiply(vector2, -1), atol=1e-8):
+    if np.allclose(vector1, -vector2, atol=1e-8):
         return rotation_matrix_arbitrary_axis(
             angle=np.pi,
             axis=orthogonal_vector(vector1)
         )
 
     v = np.cross(vector1, vector2)
-    vx = np.array([
-        [0, -v[2], v[1]],
-        [v[2], 0, -v[0]],
-        [-v[1], v[0], 0]
-    ])
+    # Fill a preallocated array, np.array() on a nested Python list
+    # is comparatively slow.
+    vx = np.zeros((3, 3))
+    vx[0, 1] = -v[2]
+    vx[0, 2] = v[1]
+    vx[1, 0] = v[2]
+    vx[1, 2] = -v[0]
+    vx[2, 0] = -v[1]
+    vx[2, 1] = v[0]
     s = np.linalg.norm(v)
     c = np.dot(vector1, vector2)
     i = np.identity(3)
-    mult_factor = (1-c)/np.square(s)
-    return i + vx + np.multiply(np.dot(vx, vx), mult_factor)
+    mult_factor = (1-c)/(s*s)
+    return i + vx + (vx @ vx)*mult_factor
 
 
 def rotation_matrix_arbitrary_axis(angle, axis):
@@ -565,24 +600,34 @@ def rotation_matrix_arbitrary_axis(angle, axis):
 
     """
 
-    a = np.cos(angle/2)
-    b, c, d = axis * np.sin(angle/2)
+    # Compute the half angle and its sine and cosine just once.
+    half_angle = angle/2
+    a = math.cos(half_angle)
+    b, c, d = axis * math.sin(half_angle)
+
+    # Plain multiplications are used because they are faster than
+    # numpy ufuncs on scalars.
+    a2, b2, c2, d2 = a*a, b*b, c*c, d*d
 
-    e11 = np.square(a) + np.square(b) - np.square(c) - np.square(d)
+    e11 = a2 + b2 - c2 - d2
     e12 = 2*(b*c - a*d)
     e13 = 2*(b*d + a*c)
 
     e21 = 2*(b*c + a*d)
-    e22 = np.square(a) + np.square(c) - np.square(b) - np.square(d)
+    e22 = a2 + c2 - b2 - d2
     e23 = 2*(c*d - a*b)
 
     e31 = 2*(b*d - a*c)
     e32 = 2*(c*d + a*b)
-    e33 = np.square(a) + np.square(d) - np.square(b) - np.square(c)
+    e33 = a2 + d2 - b2 - c2
 
-    return np.array([[e11, e12, e13],
-                     [e21, e22, e23],
-                     [e31, e32, e33]])
+    # Fill a preallocated array, np.array() on a nested Python list
+    # is comparatively slow.
+    matrix = np.empty((3, 3))
+    matrix[0] = e11, e12, e13
+    matrix[1] = e21, e22, e23
+    matrix[2] = e31, e32, e33
+    return matrix
 
 
 def dice_similarity(mol1, mol2, fp_radius=3):
@@ -643,11 +688,16 @@ def quaternion(u):
     """
 
     a, b, c = u
+    # Compute each repeated subexpression once.
+    sqrt_1_a = math.sqrt(1. - a)
+    sqrt_a = math.sqrt(a)
+    two_pi_b = 2. * np.pi * b
+    two_pi_c = 2. * np.pi * c
     q = np.zeros(4, np.float64)
-    q[0] = np.sqrt(1. - a) * np.sin(2. * np.pi * b)
-    q[1] = np.sqrt(1. - a) * np.cos(2. * np.pi * b)
-    q[2] = np.sqrt(a) * np.sin(2. * np.pi * c)
-    q[3] = np.sqrt(a) * np.cos(2. * np.pi * c)
+    q[0] = sqrt_1_a * math.sin(two_pi_b)
+    q[1] = sqrt_1_a * math.cos(two_pi_b)
+    q[2] = sqrt_a * math.sin(two_pi_c)
+    q[3] = sqrt_a * math.cos(two_pi_c)
     return q
 
 
@@ -744,11 +794,15 @@ def vector_angle(vector1, vector2):
 
     """
 
-    if np.all(np.equal(vector1, vector2)):
+    if np.array_equal(vector1, vector2):
         return 0.
 
+    # Scalar math is used because it is faster than numpy ufuncs
+    # for single values.
     numerator = np.dot(vector1, vector2)
-    denominator = np.linalg.norm(vector1) * np.linalg.norm(vector2)
+    denominator = math.sqrt(
+        np.dot(vector1, vector1) * np.dot(vector2, vector2)
+    )
     # This if statement prevents returns of NaN due to floating point
     # inaccuracy.
     term = numerator/denominator
@@ -756,7 +810,7 @@ def vector_angle(vector1, vector2):
         return 0.0
     if term <= -1.:
         return np.pi
-    return np.arccos(term)
+    return math.acos(term)
 
 
 def get_acute_vector(reference, vector):